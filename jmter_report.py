@@ -1,20 +1,135 @@
 #!/usr/bin/env python3
 import argparse
+import html
 import os
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
 import plotly.subplots as sp
-from jinja2 import Template
 import json
 import traceback
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:
+    MinMaxLTTBDownsampler = None
+
+try:
+    from pytdigest import TDigest
+except ImportError:
+    TDigest = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# Only these columns are used by the report; everything else is skipped at parse time
+REQUIRED_COLUMNS = ['timeStamp', 'elapsed', 'success', 'responseCode']
+# elapsed is not typed up front so that non-numeric values can be coerced to
+# NaN per chunk (as pd.to_numeric(errors='coerce') does) instead of failing the read
+CSV_DTYPES = {'success': 'boolean', 'responseCode': 'category'}
+if pa is not None:
+    ARROW_TYPES = {'elapsed': pa.string(), 'success': pa.bool_(),
+                   'responseCode': pa.dictionary(pa.int32(), pa.string())}
+
+    def skip_invalid_row(row):
+        """Skip malformed rows, e.g. the truncated last line of an interrupted run"""
+        print(f"Warning: Skipping malformed CSV row {row.number}: "
+              f"expected {row.expected_columns} columns, got {row.actual_columns}")
+        return 'skip'
+
+    # JMeter quotes multi-line failureMessage/responseMessage values; without this
+    # pyarrow loses sync when such a value crosses a block boundary
+    ARROW_PARSE_OPTIONS = pacsv.ParseOptions(newlines_in_values=True,
+                                             invalid_row_handler=skip_invalid_row)
+
+# Rows per chunk (pandas) / bytes per record batch (pyarrow) when streaming the CSV
+CHUNK_SIZE = 500_000
+ARROW_BLOCK_SIZE = 64 << 20
+
+# t-digest compression for elapsed percentiles; the default of 100 is off by
+# more than the report's two-decimal precision on large runs
+TDIGEST_COMPRESSION = 1000
+# Percentiles stay exact until this many elapsed values have been read; only
+# larger runs switch to the t-digest
+EXACT_PERCENTILE_LIMIT = CHUNK_SIZE
+
+MS_PER_SECOND = 1000
+
+if njit is not None:
+    @njit(cache=True)
+    def bucket_counts(ts_ms, t0_s, n_buckets):
+        """Count timestamps per one-second bucket, starting at second t0_s"""
+        out = np.zeros(n_buckets, np.int64)
+        for i in range(ts_ms.shape[0]):
+            out[ts_ms[i] // MS_PER_SECOND - t0_s] += 1
+        return out
+else:
+    def bucket_counts(ts_ms, t0_s, n_buckets):
+        """Count timestamps per one-second bucket, starting at second t0_s"""
+        return np.bincount(ts_ms // MS_PER_SECOND - t0_s, minlength=n_buckets)
+
+
+def downsample_indices(timestamps, elapsed, n_out=2000):
+    """Pick indices of representative response time samples (MinMaxLTTB)"""
+    n = len(elapsed)
+    if n <= n_out:
+        return np.arange(n)
+    if MinMaxLTTBDownsampler is None:
+        # tsdownsample not installed, fall back to evenly spaced samples
+        return np.linspace(0, n - 1, n_out).astype(np.int64)
+    ts = timestamps.view('int64')
+    if np.all(ts[1:] >= ts[:-1]):
+        return MinMaxLTTBDownsampler().downsample(ts, elapsed, n_out=n_out)
+    return MinMaxLTTBDownsampler().downsample(elapsed, n_out=n_out)
 
 class JMeterReportGenerator:
     def __init__(self, input_file, output_dir="."):
         self.input_file = input_file
         self.output_dir = output_dir
         self.output_dir = output_dir
-        self.df = None
+        self.reset_totals()
         self.create_output_dir()
+        self.set_json_engine()
+
+    def reset_totals(self):
+        """Reset the running aggregates filled in by read_csv"""
+        self.total_requests = 0
+        self.success_count = 0
+        # Elapsed aggregates are in milliseconds, converted to seconds on output
+        self.elapsed_count = 0
+        self.elapsed_sum = 0.0
+        self.elapsed_min = np.inf
+        self.elapsed_max = -np.inf
+        # Elapsed values are kept for exact percentiles until there are more
+        # than EXACT_PERCENTILE_LIMIT of them; then (with pytdigest installed)
+        # they move into a t-digest sketch that uses constant memory
+        self.elapsed_digest = None
+        self.elapsed_chunks = [np.array([], dtype=np.float32)]
+        self.code_counts = Counter()
+        self.throughput = defaultdict(int)
+        # Downsampled (timestamp, elapsed) pairs for the response time graph
+        self.sample_timestamps = [np.array([], dtype='datetime64[ms]')]
+        self.sample_elapsed = [np.array([], dtype=np.float32)]
+
+    def set_json_engine(self):
+        """Serialize figure data with orjson when it is installed"""
+        try:
+            pio.json.config.default_engine = "orjson"
+        except ValueError:
+            print("orjson not installed, using the standard json encoder for graphs")
 
     def create_output_dir(self):
         """Create output directory if it doesn't exist"""
@@ -36,56 +151,32 @@ class JMeterReportGenerator:
             print(f"Error creating output directory: {str(e)}")
 #add in the 
     def read_csv(self):
-        """Read JMeter CSV file into pandas DataFrame"""
+        """Stream the JMeter CSV file and accumulate report statistics"""
         try:
-            # Read CSV file and print its structure
+            # Read CSV header and print its structure
             print(f"Attempting to read CSV file: {self.input_file}")
-            self.df = pd.read_csv(self.input_file)
-            print("\nCSV Columns found:", self.df.columns.tolist())
-            print("\nFirst few rows of data:")
-            print(self.df.head(2))
+            columns = pd.read_csv(self.input_file, nrows=0).columns.tolist()
+            print("\nCSV Columns found:", columns)
             
             # Verify required columns exist
-            required_columns = ['timeStamp', 'elapsed', 'success', 'responseCode']
-            missing_columns = [col for col in required_columns if col not in self.df.columns]
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in columns]
             if missing_columns:
                 print(f"\nError: Missing required columns: {', '.join(missing_columns)}")
-                print(f"Available columns are: {', '.join(self.df.columns)}")
-                return False
-            
-            # Convert timestamp to datetime
-            try:
-                print("\nConverting timestamp column...")
-                self.df['timeStamp'] = pd.to_datetime(self.df['timeStamp'], unit='ms')
-            except Exception as e:
-                print(f"Error converting timestamp: {str(e)}")
-                print("Sample timestamp values:", self.df['timeStamp'].head())
-                return False
-            
-            # Convert elapsed to numeric and from milliseconds to seconds
-            try:
-                print("\nConverting elapsed time to seconds...")
-                self.df['elapsed'] = pd.to_numeric(self.df['elapsed'], errors='coerce')
-                print("Sample elapsed times (ms):", self.df['elapsed'].head())
-                # Check for any NaN values after conversion
-                if self.df['elapsed'].isna().any():
-                    print("Warning: Some response times could not be converted to numbers")
-                    print("Rows with invalid elapsed times:", 
-                          self.df[self.df['elapsed'].isna()].index.tolist())
-                self.df['elapsed'] = self.df['elapsed'] / 1000.0
-                print("Sample elapsed times (s):", self.df['elapsed'].head())
-            except Exception as e:
-                print(f"Error converting response times: {str(e)}")
+                print(f"Available columns are: {', '.join(columns)}")
                 return False
             
-            # Ensure success column is boolean
-            try:
-                print("\nConverting success column to boolean...")
-                self.df['success'] = self.df['success'].astype(bool)
-            except Exception as e:
-                print(f"Error converting success column: {str(e)}")
-                print("Sample success values:", self.df['success'].head())
-                return False
+            self.reset_totals()
+            for i, chunk in enumerate(self.iter_chunks()):
+                if i == 0:
+                    print("\nFirst few rows of data:")
+                    print(chunk.head(2))
+                try:
+                    self.accumulate_chunk(chunk)
+                except Exception as e:
+                    print(f"Error processing rows: {str(e)}")
+                    print("Sample rows:", chunk.head())
+                    return False
+                print(f"Processed {self.total_requests} rows...")
             
             print("\nCSV file processed successfully!")
             return True
@@ -93,22 +184,154 @@ class JMeterReportGenerator:
             print(f"\nError processing CSV data: {str(e)}")
             return False
 
-        except Exception as e:
-            print(f"\nError reading CSV file: {str(e)}")
-            return False
+    def iter_chunks(self):
+        """Yield the required columns of the CSV file in chunks"""
+        if pa is None:
+            yield from pd.read_csv(self.input_file, usecols=REQUIRED_COLUMNS,
+                                   dtype=CSV_DTYPES, chunksize=CHUNK_SIZE)
+            return
+        # pandas' pyarrow engine can't chunk, so stream record batches directly
+        reader = pacsv.open_csv(
+            self.input_file,
+            read_options=pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+            parse_options=ARROW_PARSE_OPTIONS,
+            # strings_can_be_null reads blank response codes as missing, like pandas
+            convert_options=pacsv.ConvertOptions(include_columns=REQUIRED_COLUMNS,
+                                                 column_types=ARROW_TYPES,
+                                                 strings_can_be_null=True)
+        )
+        for batch in reader:
+            # Cast elapsed in Arrow when every value is numeric; otherwise leave
+            # the strings for accumulate_chunk to coerce
+            try:
+                elapsed = pc.cast(batch.column('elapsed'), pa.float32())
+            except pa.ArrowInvalid:
+                yield batch.to_pandas()
+                continue
+            columns = [elapsed if name == 'elapsed' else column
+                       for name, column in zip(batch.schema.names, batch.columns)]
+            yield pa.RecordBatch.from_arrays(columns, names=batch.schema.names).to_pandas()
+
+    def accumulate_chunk(self, chunk):
+        """Fold one chunk of rows into the running aggregates"""
+        if len(chunk) == 0:
+            return
+        # JMeter writes epoch milliseconds, so an int64 column can be
+        # reinterpreted as datetime64[ms] without converting anything
+        if chunk['timeStamp'].dtype == np.int64:
+            timestamps = chunk['timeStamp'].to_numpy().view('datetime64[ms]')
+        else:
+            timestamps = pd.to_datetime(chunk['timeStamp'], unit='ms', cache=True).values
+            timestamps = timestamps.astype('datetime64[ms]', copy=False)
+        # Blank timestamps become NaT; those rows count towards the totals but
+        # can't be placed on the throughput or response time time axes
+        has_timestamp = ~np.isnat(timestamps)
+        if not has_timestamp.all():
+            print("Warning: Some timestamps could not be converted")
+            print("Rows with invalid timestamps:",
+                  (self.total_requests + np.flatnonzero(~has_timestamp)).tolist())
+        # Keep elapsed in milliseconds as float32: it holds JMeter's integer
+        # values exactly and halves the bytes of every later pass
+        if not pd.api.types.is_numeric_dtype(chunk['elapsed']):
+            chunk['elapsed'] = pd.to_numeric(chunk['elapsed'], errors='coerce')
+        elapsed = chunk['elapsed'].to_numpy(dtype=np.float32, na_value=np.nan)
+        # Blank or non-numeric elapsed cells are NaN; skip them in the response
+        # time statistics and graph but still count the rows as requests
+        invalid = np.isnan(elapsed)
+        if invalid.any():
+            print("Warning: Some response times could not be converted to numbers")
+            print("Rows with invalid elapsed times:",
+                  (self.total_requests + np.flatnonzero(invalid)).tolist())
+        sample_mask = has_timestamp & ~invalid
+        sample_timestamps = timestamps[sample_mask]
+        sample_elapsed = elapsed[sample_mask]
+        elapsed = elapsed[~invalid]
+
+        self.total_requests += len(chunk)
+        # A blank success cell is read as missing and counted as a failure
+        self.success_count += int(np.count_nonzero(chunk['success'].to_numpy(dtype=bool, na_value=False)))
+        if len(elapsed):
+            self.elapsed_count += len(elapsed)
+            self.elapsed_sum += float(elapsed.sum(dtype=np.float64))
+            self.elapsed_min = min(self.elapsed_min, float(elapsed.min()))
+            self.elapsed_max = max(self.elapsed_max, float(elapsed.max()))
+            if self.elapsed_digest is not None:
+                self.update_digest(elapsed)
+            else:
+                self.elapsed_chunks.append(elapsed)
+                if TDigest is not None and self.elapsed_count > EXACT_PERCENTILE_LIMIT:
+                    self.elapsed_digest = TDigest(TDIGEST_COMPRESSION)
+                    self.update_digest(np.concatenate(self.elapsed_chunks))
+                    self.elapsed_chunks = [np.array([], dtype=np.float32)]
+
+        # responseCode is read as a category, so count its integer codes
+        # instead of hashing every response code string
+        codes = chunk['responseCode'].cat.codes.to_numpy()
+        categories = chunk['responseCode'].cat.categories
+        code_counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        for code, count in zip(categories.tolist(), code_counts.tolist()):
+            if count:
+                self.code_counts[code] += count
+
+        ts_ms = timestamps[has_timestamp].view('int64')
+        if len(ts_ms):
+            self.accumulate_throughput(ts_ms)
+
+        idx = downsample_indices(sample_timestamps, sample_elapsed)
+        self.sample_timestamps.append(sample_timestamps[idx])
+        self.sample_elapsed.append(sample_elapsed[idx])
+
+    def accumulate_throughput(self, ts_ms):
+        """Add epoch-ms timestamps to the per-second throughput counts"""
+        # Buckets are usually dense consecutive seconds, so count them into an
+        # array rather than hashing each timestamp
+        t0 = int(ts_ms.min() // MS_PER_SECOND)
+        n_buckets = int(ts_ms.max() // MS_PER_SECOND) - t0 + 1
+        if n_buckets <= 4 * len(ts_ms):
+            counts = bucket_counts(ts_ms, t0, n_buckets)
+            seconds = np.flatnonzero(counts)
+            counts = counts[seconds]
+            seconds += t0
+        else:
+            # Sparse chunk (long gaps between samples): sort the integer
+            # second ids instead of allocating a mostly empty array
+            seconds, counts = np.unique(ts_ms // MS_PER_SECOND, return_counts=True)
+        for second, count in zip(seconds.tolist(), counts.tolist()):
+            self.throughput[second] += count
+
+    def update_digest(self, values):
+        """Add elapsed values to the t-digest"""
+        # pytdigest can't convert a 1-element array to a scalar, so pass it as one
+        if len(values) == 1:
+            self.elapsed_digest.update(float(values[0]))
+        else:
+            self.elapsed_digest.update(values)
 
     def generate_response_time_graph(self):
         """Generate response time graph"""
+        # The static report can't resample on zoom, so reduce the per-chunk
+        # samples once more to a fixed number of points
+        timestamps = np.concatenate(self.sample_timestamps)
+        elapsed = np.concatenate(self.sample_elapsed)
+        idx = downsample_indices(timestamps, elapsed)
+        # WebGL scales to large sample counts where SVG freezes the browser.
+        # Markers alone read best on tiny runs, but they cost a draw per point
+        # and are indistinguishable at high counts, so drop them on big runs
+        n = self.total_requests
+        mode = 'markers' if n < 200 else ('lines+markers' if n < 2000 else 'lines')
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=self.df['timeStamp'],
-            y=self.df['elapsed'],
-            mode='lines+markers',
+        # Plotly base64-encodes float arrays but writes datetime64 as ISO strings,
+        # so send epoch milliseconds on a date axis instead
+        fig.add_trace(go.Scattergl(
+            x=timestamps[idx].view('int64').astype(np.float64),
+            y=elapsed[idx] / 1000,
+            mode=mode,
             name='Response Time'
         ))
         fig.update_layout(
             title='Response Time Over Time',
             xaxis_title='Time',
+            xaxis_type='date',
             yaxis_title='Response Time (s)',
             template='plotly_white'
         )
@@ -116,17 +339,22 @@ class JMeterReportGenerator:
 
     def generate_throughput_graph(self):
         """Generate throughput graph (requests per second)"""
-        throughput = self.df.groupby(pd.Timestamp.floor(self.df['timeStamp'], '1S')).size()
+        n = len(self.throughput)
+        seconds = np.fromiter(self.throughput.keys(), dtype=np.int64, count=n)
+        counts = np.fromiter(self.throughput.values(), dtype=np.int64, count=n)
+        order = np.argsort(seconds)
+        seconds, counts = seconds[order], counts[order]
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=throughput.index,
-            y=throughput.values,
+            x=(seconds * 1000).astype(np.float64),
+            y=counts,
             mode='lines',
             name='Throughput'
         ))
         fig.update_layout(
             title='Throughput (Requests per Second)',
             xaxis_title='Time',
+            xaxis_type='date',
             yaxis_title='Requests/Second',
             template='plotly_white'
         )
@@ -134,10 +362,12 @@ class JMeterReportGenerator:
 
     def generate_error_distribution(self):
         """Generate error distribution pie chart"""
-        error_dist = self.df['responseCode'].value_counts()
+        # Counts were accumulated while reading; most_common keeps the
+        # largest-first order value_counts used to give
+        code_counts = self.code_counts.most_common()
         fig = go.Figure(data=[go.Pie(
-            labels=error_dist.index,
-            values=error_dist.values,
+            labels=[code for code, _ in code_counts],
+            values=[count for _, count in code_counts],
             hole=.3
         )])
         fig.update_layout(
@@ -154,70 +384,74 @@ class JMeterReportGenerator:
                 except:
                     return 0.0
 
+            # No valid samples (e.g. a header-only CSV): nothing to summarize
+            if not self.elapsed_count:
+                return {'Total Requests': self.total_requests}
+
+            if self.elapsed_digest is not None:
+                percentiles = self.elapsed_digest.inverse_cdf([0.50, 0.90, 0.95, 0.99])
+            else:
+                # Compute all percentiles from a single partition of the elapsed
+                # values, done in place on the concatenated buffer instead of a
+                # copy; the buffer replaces the chunks so later calls reuse it
+                elapsed = np.concatenate(self.elapsed_chunks)
+                self.elapsed_chunks = [elapsed]
+                percentiles = np.percentile(elapsed, [50, 90, 95, 99], overwrite_input=True)
+            p50, p90, p95, p99 = np.asarray(percentiles, dtype=np.float64) / 1000.0
+
             stats = {
-                'Total Requests': len(self.df),
-                'Average Response Time (s)': safe_round(self.df['elapsed'].mean()),
-                'Median Response Time (s)': safe_round(self.df['elapsed'].median()),
-                'Min Response Time (s)': safe_round(self.df['elapsed'].min()),
-                'Max Response Time (s)': safe_round(self.df['elapsed'].max()),
-                'Success Rate (%)': safe_round(self.df['success'].mean() * 100),
-                '90th Percentile (s)': safe_round(self.df['elapsed'].quantile(0.90)),
-                '95th Percentile (s)': safe_round(self.df['elapsed'].quantile(0.95)),
-                '99th Percentile (s)': safe_round(self.df['elapsed'].quantile(0.99))
+                'Total Requests': self.total_requests,
+                'Average Response Time (s)': safe_round(self.elapsed_sum / self.elapsed_count / 1000.0),
+                'Median Response Time (s)': safe_round(p50),
+                'Min Response Time (s)': safe_round(self.elapsed_min / 1000.0),
+                'Max Response Time (s)': safe_round(self.elapsed_max / 1000.0),
+                'Success Rate (%)': safe_round(self.success_count / self.total_requests * 100),
+                '90th Percentile (s)': safe_round(p90),
+                '95th Percentile (s)': safe_round(p95),
+                '99th Percentile (s)': safe_round(p99)
             }
             return stats
         except Exception as e:
             print(f"Error calculating statistics: {str(e)}")
             return {
-                'Total Requests': len(self.df),
+                'Total Requests': self.total_requests,
                 'Error': 'Unable to calculate complete statistics'
             }
 
     def process_csv_data(self):
         """Process the CSV data and calculate statistics"""
-        try:
-            print(f"\nReading CSV file: {self.input_file}...")
-            self.df = pd.read_csv(self.input_file)
-            
-            # Convert timestamp to datetime
-            print("Converting timestamp column...")
-            self.df['timeStamp'] = pd.to_datetime(self.df['timeStamp'], unit='ms')
-            
-            # Convert elapsed time to seconds
-            print("Converting elapsed time to seconds...")
-            self.df['elapsed'] = pd.to_numeric(self.df['elapsed']) / 1000.0
-            # Ensure success column is boolean
-            try:
-                print("Converting success column to boolean...")
-                self.df['success'] = self.df['success'].astype(bool)
-            except Exception as e:
-                print(f"Error converting success column: {str(e)}")
-                print("Sample success values:", self.df['success'].head())
-                return False
-
-            print("\nCSV file processed successfully!")
-            return True
-        except Exception as e:
-            print(f"\nError processing CSV data: {str(e)}")
-            return False
+        print(f"\nReading CSV file: {self.input_file}...")
+        return self.read_csv()
 
     def generate_html_report(self):
         """Generate HTML report with graphs and statistics"""
         try:
             print("\nGenerating HTML report...")
             
-            # Generate graphs
-            print("Generating response time graph...")
-            response_time_graph = self.generate_response_time_graph()
-            response_time_div = response_time_graph.to_html(full_html=False)
-            
-            print("Generating throughput graph...")
-            throughput_graph = self.generate_throughput_graph()
-            throughput_div = throughput_graph.to_html(full_html=False)
-            
-            print("Generating error distribution graph...")
-            error_dist_graph = self.generate_error_distribution()
-            error_dist_div = error_dist_graph.to_html(full_html=False)
+            # Specialize the report to the data: with no samples there is nothing
+            # to plot, and with a single response code the pie chart is one slice
+            divs = dict.fromkeys(['response_time', 'throughput'], '<p>No samples were recorded.</p>')
+            graph_generators = {}
+            if self.total_requests:
+                graph_generators['response_time'] = self.generate_response_time_graph
+                graph_generators['throughput'] = self.generate_throughput_graph
+            if len(self.code_counts) > 1:
+                graph_generators['error_distribution'] = self.generate_error_distribution
+            elif self.code_counts:
+                (code, count), = self.code_counts.items()
+                divs['error_distribution'] = f'<p>All {count} responses returned {html.escape(str(code))}</p>'
+            else:
+                divs['error_distribution'] = '<p>No response codes were recorded.</p>'
+
+            # Generate graphs concurrently; they only read the accumulated
+            # totals and most of the work is in numpy/orjson
+            if graph_generators:
+                print(f"Generating graphs: {', '.join(graph_generators)}...")
+                with ThreadPoolExecutor(max_workers=len(graph_generators)) as executor:
+                    divs.update(zip(graph_generators, executor.map(
+                        lambda generate: generate().to_html(full_html=False, include_plotlyjs=False),
+                        graph_generators.values()
+                    )))
             
             # Calculate statistics
             print("Calculating statistics...")
@@ -225,10 +459,10 @@ class JMeterReportGenerator:
             print("Statistics calculated:", stats)
 
             # Create stats HTML
-            stats_divs = []
-            for key, value in stats.items():
-                stats_divs.append(f'<div class="stat-box"><div class="stat-value">{value}</div><div class="stat-label">{key}</div></div>')
-            stats_html = '\n'.join(stats_divs)
+            stats_html = '\n'.join(
+                f'<div class="stat-box"><div class="stat-value">{value}</div><div class="stat-label">{key}</div></div>'
+                for key, value in stats.items()
+            )
 
             # Create HTML content
             print("Creating HTML content...")
@@ -251,6 +485,10 @@ class JMeterReportGenerator:
                 '<style>',
                 style,
                 '</style>',
+                # plotly.js is embedded once here rather than in every graph div
+                '<script type="text/javascript">',
+                get_plotlyjs() if graph_generators else '',
+                '</script>',
                 '</head>',
                 '<body>',
                 '<div class="container">',
@@ -259,11 +497,11 @@ class JMeterReportGenerator:
                 stats_html,
                 '</div>',
                 '<h2>Response Time Graph</h2>',
-                response_time_div,
+                divs['response_time'],
                 '<h2>Throughput Graph</h2>',
-                throughput_div,
+                divs['throughput'],
                 '<h2>Response Code Distribution</h2>',
-                error_dist_div,
+                divs['error_distribution'],
                 '</div>',
                 '</body>',
                 '</html>'
@@ -273,10 +511,11 @@ class JMeterReportGenerator:
             output_path = os.path.join(self.output_dir, "jmeter_report.html")
             print(f"Writing HTML report to {output_path}...")
             os.makedirs(self.output_dir, exist_ok=True)
-            with open(output_path, "w") as f:
-                f.write(html_content)
+            # Binary mode with a large buffer skips text-mode newline translation
+            # and writes the multi-MB report in few syscalls
+            with open(output_path, "wb", buffering=1 << 20) as f:
+                f.write(html_content.encode('utf-8'))
 
-            # (HTML already generated and written above; skipping Jinja rendering)
             print(f"Report generated successfully at: {output_path}")
             return output_path
             
@@ -0,0 +1,56 @@
+import jmter_report
+
+HEADER = 'timeStamp,elapsed,label,responseCode,success\n'
+
+
+def write_csv(tmp_path, rows):
+    csv_file = tmp_path / 'results.csv'
+    csv_file.write_text(HEADER + ''.join(rows))
+    return str(csv_file)
+
+
+def test_one_row_csv(tmp_path):
+    csv_file = write_csv(tmp_path, ['1700000000000,250,GET /,200,true\n'])
+    generator = jmter_report.JMeterReportGenerator(csv_file, str(tmp_path))
+    assert generator.read_csv()
+    stats = generator.calculate_statistics()
+    assert stats['Total Requests'] == 1
+    assert stats['Median Response Time (s)'] == 0.25
+    assert generator.generate_html_report()
+
+
+def test_one_row_last_chunk(tmp_path, monkeypatch):
+    # pandas path with a final chunk holding a single row, fed to the t-digest
+    monkeypatch.setattr(jmter_report, 'pa', None)
+    monkeypatch.setattr(jmter_report, 'CHUNK_SIZE', 3)
+    monkeypatch.setattr(jmter_report, 'EXACT_PERCENTILE_LIMIT', 0)
+    rows = [f'17000000{i:05d},{100 * (i + 1)},GET /,200,true\n' for i in range(4)]
+    generator = jmter_report.JMeterReportGenerator(write_csv(tmp_path, rows), str(tmp_path))
+    assert generator.read_csv()
+    stats = generator.calculate_statistics()
+    assert stats['Total Requests'] == 4
+    assert stats['Max Response Time (s)'] == 0.4
+
+
+def test_small_run_percentiles_are_exact(tmp_path):
+    rows = [f'17000000{i:05d},{elapsed},GET /,200,true\n'
+            for i, elapsed in enumerate([120, 80, 3000, 450, 95, 2750, 60, 310, 200, 90])]
+    generator = jmter_report.JMeterReportGenerator(write_csv(tmp_path, rows), str(tmp_path))
+    assert generator.read_csv()
+    stats = generator.calculate_statistics()
+    assert stats['Median Response Time (s)'] == 0.16
+    assert stats['95th Percentile (s)'] == 2.89
+    assert stats['99th Percentile (s)'] == 2.98
+
+
+def test_blank_timestamp_stays_off_time_axes(tmp_path):
+    rows = ['1700000000000,100,GET /,200,true\n',
+            ',200,GET /,200,true\n',
+            '1700000001000,300,GET /,200,true\n']
+    generator = jmter_report.JMeterReportGenerator(write_csv(tmp_path, rows), str(tmp_path))
+    assert generator.read_csv()
+    assert generator.total_requests == 3
+    assert dict(generator.throughput) == {1700000000: 1, 1700000001: 1}
+    response_times = generator.generate_response_time_graph().data[0]
+    assert list(response_times.x) == [1700000000000.0, 1700000001000.0]
+    assert generator.calculate_statistics()['Max Response Time (s)'] == 0.3